@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+benchmark.py
+------------
+Times intent matching (`predict_intent`) for messages of different lengths,
+from a one-word greeting up to a very long paste. Caching is turned off so
+every call really runs the regexes.
+
+Run it before and after changing the matching code in engine.py:
+
+    python benchmark.py
+
+The numbers depend on whether google-re2 is installed (the first line says
+which engine is used).
+"""
+
+from pathlib import Path
+import sys
+import timeit
+
+# Ensure src is importable without installing the package
+ROOT = Path(__file__).resolve().parent
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from mini_ai import engine  # noqa: E402
+
+
+def main():
+    loaded = engine.build_from_yaml(str(ROOT / "data" / "intents.yml"), use_cache=False)
+    # Same intents, but with the result cache disabled
+    bot = engine.MiniAI(loaded.intents, default_response=loaded.default_response, cache_size=0)
+
+    sentence = "so I was wondering whether you could tell me something about the forecast for the weekend "
+    messages = {
+        "short (2 chars)": "hi",
+        "typical (108 chars)": (sentence * 2)[:108],
+        "long (2,000 chars)": (sentence * 25)[:2000],
+        "huge (20,000 chars)": (sentence * 250)[:20000],
+    }
+
+    print(f"Regex engine: {'RE2 (google-re2)' if engine.re2 is not None else 're (standard library)'}")
+    for label, text in messages.items():
+        number = 200 if len(text) > 5000 else 2000
+        seconds = min(timeit.repeat(lambda: bot.predict_intent(text), number=number, repeat=3)) / number
+        print(f"{label:>22}: {seconds * 1e6:9.2f} µs per message")
+
+
+if __name__ == "__main__":
+    main()
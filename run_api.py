@@ -5,6 +5,7 @@ run_api.py
 Convenience script to run the FastAPI server with Uvicorn.
 Visit http://localhost:8000 to open the React page.
 """
+from importlib.util import find_spec
 from pathlib import Path
 import os
 import sys
@@ -24,6 +25,10 @@ def main():
     log_level = os.getenv("LOG_LEVEL", "info")
     access_log_env = os.getenv("ACCESS_LOG", "true").lower()
     access_log = access_log_env in {"1", "true", "yes", "on"}
+    # Use the fast C-based event loop and HTTP parser from uvicorn[standard]
+    # when they're installed (uvloop isn't available on Windows).
+    loop = "uvloop" if find_spec("uvloop") else "auto"
+    http = "httptools" if find_spec("httptools") else "auto"
     uvicorn.run(
         "mini_ai.server:app",
         host=host,
@@ -31,6 +36,8 @@ def main():
         reload=False,
         log_level=log_level,
         access_log=access_log,
+        loop=loop,
+        http=http,
     )
 
 
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+setup.py
+--------
+Packaging for the `mini_ai` package. `pip install .` installs it as plain
+Python, together with the dependencies from requirements.txt.
+
+Optional build step: compile the bot's engine (src/mini_ai/engine.py) into a
+C extension with mypyc, which removes most of the Python interpreter overhead
+from matching and replying. Everything works without this; it's only for
+extra speed. It needs mypy and a C compiler, and is switched on with the
+MINI_AI_MYPYC=1 environment variable:
+
+    pip install mypy
+    MINI_AI_MYPYC=1 python setup.py build_ext --inplace
+
+This puts a compiled `engine` module (.so / .pyd) next to engine.py, and Python
+imports it instead of the .py file. After editing engine.py, run the command
+again (or delete the compiled file) so your changes are picked up.
+
+To install a compiled package instead, use the mypy you installed rather than
+pip's isolated build environment:
+
+    MINI_AI_MYPYC=1 pip install --no-build-isolation .
+"""
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.getenv("MINI_AI_MYPYC", "").lower() in {"1", "true", "yes", "on"}:
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["src/mini_ai/engine.py"])
+
+setup(
+    name="mini-ai",
+    package_dir={"": "src"},
+    packages=["mini_ai"],
+    # Keep in sync with requirements.txt
+    install_requires=[
+        "PyYAML>=6.0,<7",
+        "fastapi>=0.110,<1",
+        "orjson>=3.9,<4",
+        "uvicorn[standard]>=0.23,<1",
+    ],
+    ext_modules=ext_modules,
+)
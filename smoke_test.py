@@ -16,12 +16,12 @@ SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
-from mini_ai.engine import build_from_yaml  # noqa: E402
+from mini_ai.engine import Intent, MiniAI, build_from_yaml  # noqa: E402
 
 
 def main():
-    # Build the bot from the YAML intents file
-    bot = build_from_yaml(str(ROOT / "data" / "intents.yml"))
+    # Build the bot from the YAML intents file (without writing the JSON cache)
+    bot = build_from_yaml(str(ROOT / "data" / "intents.yml"), use_cache=False)
 
     # A small set of inputs and the intent we expect them to match
     tests = {
@@ -41,7 +41,57 @@ def main():
         if ok:
             passed += 1
 
-    print(f"\nPassed {passed}/{len(tests)} basic checks.")
+    # Patterns using less common regex features: inline flags, the same group
+    # name in two patterns, backreferences, and \b / \w with non-ASCII letters
+    regex_bot = MiniAI(
+        {
+            "flag_i": Intent(name="flag_i", patterns=["(?i)hello"], responses=["flag_i"]),
+            "flag_m": Intent(name="flag_m", patterns=["(?m)^yo$"], responses=["flag_m"]),
+            "flag_x": Intent(name="flag_x", patterns=[r"(?x) good \s+ night"], responses=["flag_x"]),
+            "named": Intent(name="named", patterns=["(?P<w>foo)", "(?P<w>bar)"], responses=["named"]),
+            "backref": Intent(name="backref", patterns=[r"(\w)\1"], responses=["backref"]),
+            "unicode": Intent(name="unicode", patterns=[r"\bcafé\b", r"^\w+$"], responses=["unicode"]),
+            "fallback": Intent(name="fallback", patterns=[".*"], responses=["fallback"]),
+        }
+    )
+    regex_tests = {
+        "HELLO": "flag_i",
+        "yo": "flag_m",
+        "good   night": "flag_x",
+        "foo": "named",
+        "bar": "named",
+        "aa": "backref",
+        "café please": "unicode",
+        "naïve": "unicode",
+        "große": "unicode",
+        "a b": "fallback",
+    }
+    for text, expected_intent in regex_tests.items():
+        intent, entities = regex_bot.predict_intent(text)
+        ok = intent == expected_intent
+        print(f"Input: {text!r} -> intent: {intent!r} | {'OK' if ok else 'FAIL'}")
+        if ok:
+            passed += 1
+
+    # Non-ASCII names: like the original bot, extract no name rather than a
+    # cut-short one (e.g. "Zo" from "Zoë")
+    for text in ("I am Zoë", "i'm Renée"):
+        intent, entities = bot.predict_intent(text)
+        ok = "name" not in entities
+        print(f"Input: {text!r} -> intent: {intent!r}, entities: {entities} | {'OK' if ok else 'FAIL'}")
+        if ok:
+            passed += 1
+
+    # A repeated message is answered from the cache; it must give the same result
+    first = bot.predict_intent("my name is Alice")
+    second = bot.predict_intent("my name is Alice")
+    ok = first == second
+    print(f"Repeated input: {first} then {second} | {'OK' if ok else 'FAIL'}")
+    if ok:
+        passed += 1
+
+    total = len(tests) + len(regex_tests) + 2 + 1
+    print(f"\nPassed {passed}/{total} basic checks.")
 
 
 if __name__ == "__main__":
@@ -13,10 +13,110 @@ This file contains the tiny "brain" of our mini AI chatbot. It:
 The goal is to keep this easy to read for beginners.
 """
 
+import functools
+import hashlib
+import json
+import os
 import re
 import random
+import string
+import sys
+from pathlib import Path
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Tuple
+
+try:
+    # Optional: Google's RE2 engine matches in linear time (no catastrophic
+    # backtracking on long or nasty input). Install with `pip install google-re2`.
+    import re2  # type: ignore[import-not-found,import-untyped]
+except ImportError:
+    re2 = None
+
+# RE2 settings: case-insensitive, and don't log patterns RE2 rejects (they
+# fall back to `re`, see _compile)
+_RE2_OPTIONS: Any = None
+if re2 is not None:
+    _RE2_OPTIONS = re2.Options()
+    _RE2_OPTIONS.case_sensitive = False
+    _RE2_OPTIONS.log_errors = False
+
+
+# Finds \b \B \w \W \d \D \s \S in a pattern (but not an escaped backslash
+# followed by one of those letters, like "\\s")
+_PERL_CLASS_RE = re.compile(r"(?<!\\)(?:\\\\)*\\[bBwWdDsS]")
+
+
+def _compile(pattern: str) -> Any:
+    """Compile a case-insensitive regex, preferring RE2 when it's installed.
+
+    RE2 doesn't support every Python regex feature (e.g. lookarounds or
+    backreferences), so we quietly fall back to the standard `re` module
+    for patterns it rejects. Patterns using word boundaries or classes like
+    \w and \s also stay on `re`: in RE2 those only understand ASCII, so
+    "naïve" or "café" would stop matching.
+    """
+    if re2 is not None and not _PERL_CLASS_RE.search(pattern):
+        try:
+            return re2.compile(pattern, _RE2_OPTIONS)
+        except re2.error:
+            pass
+    return re.compile(pattern, re.IGNORECASE)
+
+
+# Name patterns, compiled once at import time (see MiniAI._extract_name).
+# These always use `re`: RE2's \b only knows ASCII letters, so "I am Zoë"
+# would give the name "Zo" instead of no name at all.
+_NAME_RE_1 = re.compile(r"\b(?:i am|i'm|im)\s+([A-Z][a-z]+)\b", re.IGNORECASE)
+_NAME_RE_2 = re.compile(r"\bmy\s+name\s+is\s+([A-Z][a-z]+)\b", re.IGNORECASE)
+
+
+class _SafeDict(dict):
+    """Dict for str.format_map: a missing placeholder becomes "" instead of raising an error."""
+
+    def __missing__(self, key):  # type: ignore[override]
+        return ""
+
+
+# Only messages up to this many characters go into MiniAI's result cache
+_CACHE_MAX_LEN = 64
+
+# Name of the intent used when nothing else matches
+_FALLBACK = sys.intern("fallback")
+
+
+def _current_time() -> str:
+    """The current time like "3:07 PM"."""
+    return datetime.now().strftime("%I:%M %p").lstrip("0")
+
+
+# Intents whose replies need a live value: intent name -> (placeholder, function
+# that computes it). Add an entry here to make another placeholder dynamic.
+_DYNAMIC: dict[str, tuple[str, Callable[[], str]]] = {
+    "time": ("time", _current_time),
+}
+
+# A pre-parsed template: (literal text, placeholder name or None) pairs
+_Parts = List[Tuple[str, Optional[str]]]
+
+
+def _parse_template(template: str) -> Optional[_Parts]:
+    """Split a response template like "Hi {name}!" into literal/placeholder parts.
+
+    Rendering the parts is just a join, so the template doesn't have to be
+    parsed again for every reply. Returns None for templates that use more
+    than plain `{name}` placeholders (format specs, conversions, `{a.b}`,
+    malformed braces); those are rendered with str.format_map as usual.
+    """
+    parts: _Parts = []
+    try:
+        for literal, field, spec, conversion in string.Formatter().parse(template):
+            if field is not None and (not field.isidentifier() or spec or conversion):
+                return None
+            parts.append((literal, field))
+    except ValueError:
+        return None
+    return parts
 
 
 # An Intent groups together:
@@ -26,30 +126,72 @@ from typing import Dict, List, Optional, Tuple
 @dataclass
 class Intent:
     name: str
-    patterns: List[str]
-    responses: List[str]
+    patterns: list[str]
+    responses: list[str]
 
 
 class MiniAI:
     """A tiny rule-based intent matcher with lightweight entity extraction.
 
     How it works (in short):
-    1) Compile all regex patterns so they're fast to use
+    1) Compile all regex patterns once so they're fast to use
     2) When a message comes in:
        - Try to extract simple "entities" (like a name)
        - Find the first intent whose pattern matches the text
+         (results are cached for repeated messages)
        - If nothing matches, use the "fallback" intent
        - Choose a response and fill in any placeholders
     """
 
-    def __init__(self, intents: Dict[str, Intent], default_response: str = "I'm not sure I understand.") -> None:
-        self.intents = intents
+    def __init__(
+        self,
+        intents: dict[str, Intent],
+        default_response: str = "I'm not sure I understand.",
+        cache_size: int = 4096,
+    ) -> None:
+        # Intern the intent names: predict_intent hands back these exact string
+        # objects, so the dict lookups in render_response hit on identity.
+        self.intents = {sys.intern(name): intent for name, intent in intents.items()}
         self.default_response = default_response
-        # Compile each regex once (case-insensitive) for better performance
-        self._compiled: Dict[str, List[re.Pattern]] = {
-            name: [re.compile(p, re.IGNORECASE) for p in intent.patterns]
-            for name, intent in intents.items()
-        }
+        # Remember the match results for the last `cache_size` distinct short
+        # messages (chat traffic repeats a lot: "hi", "hello", "bye", ...).
+        # 0 disables it. Longer messages (see _CACHE_MAX_LEN) aren't cached,
+        # so the cache can't fill up with big one-off texts.
+        self._match_cached = functools.lru_cache(maxsize=cache_size)(self._match)
+        # Compile each pattern once (case-insensitive), keeping YAML order. A
+        # malformed pattern (like "foo)|(bar") raises an error right here.
+        #
+        # With google-re2 installed, every pattern RE2 understands also goes
+        # into one RE2 Set, which checks all of them in a single pass over the
+        # text and reports which ones matched. Patterns RE2 can't handle (e.g.
+        # backreferences) are searched one by one with `re`. Without RE2 we
+        # simply try the patterns in order, which is fastest for `re`.
+        # (benchmark.py measures both.)
+        #
+        # The same single pass over the intents also pre-parses every response
+        # template (see _parse_template). Intents without responses use the
+        # default response instead.
+        self._patterns: list[tuple[Any, str]] = []  # (compiled pattern, intent) in YAML order
+        self._set: Optional[Any] = re2.Set.SearchSet(_RE2_OPTIONS) if re2 is not None else None
+        self._set_index: list[int] = []  # RE2 Set index -> position in _patterns
+        self._not_in_set: list[int] = []  # positions in _patterns searched one by one
+        add_pattern = self._patterns.append
+        self._templates: dict[str, list[tuple[str, Optional[_Parts]]]] = {}
+        for name, intent in self.intents.items():
+            for pat in intent.patterns:
+                compiled = _compile(pat)
+                if self._set is not None and not isinstance(compiled, re.Pattern):
+                    self._set.Add(pat)
+                    self._set_index.append(len(self._patterns))
+                else:
+                    self._not_in_set.append(len(self._patterns))
+                add_pattern((compiled, name))
+            self._templates[name] = [(t, _parse_template(t)) for t in (intent.responses or [default_response])]
+        if self._set is not None:
+            if self._set_index:
+                self._set.Compile()
+            else:
+                self._set = None
 
     @staticmethod
     def _extract_name(text: str) -> Optional[str]:
@@ -62,41 +204,58 @@ class MiniAI:
 
         NOTE: This is intentionally simple to keep it beginner-friendly.
         """
-        name_patterns = [
-            r"\b(?:i am|i'm|im)\s+([A-Z][a-z]+)\b",
-            r"\bmy\s+name\s+is\s+([A-Z][a-z]+)\b",
-        ]
-        for pat in name_patterns:
-            m = re.search(pat, text, flags=re.IGNORECASE)
+        for pat in (_NAME_RE_1, _NAME_RE_2):
+            m = pat.search(text)
             if m:
                 # Normalize the name to Capitalized form (e.g., "alice" -> "Alice")
-                return m.group(1).strip().capitalize()
+                return m.group(1).capitalize()
         return None
 
-    def predict_intent(self, text: str) -> Tuple[str, Dict[str, str]]:
+    def _match(self, text: str) -> tuple[str, Optional[str]]:
+        """Run the regexes on (already stripped) text: return (intent name, name or None)."""
+        # Extract entities regardless of which intent we end up with
+        name = self._extract_name(text)
+
+        # Find the first pattern (in YAML order) that matches the text. If
+        # nothing matches, fall back to a special intent.
+        best_intent = _FALLBACK
+        if self._set is not None:
+            # The Set reports every RE2 pattern that matched; the earliest one
+            # wins unless a non-RE2 pattern before it matches too.
+            hits = self._set.Match(text)
+            best = self._set_index[min(hits)] if hits else len(self._patterns)
+            for i in self._not_in_set:
+                if i >= best:
+                    break
+                if self._patterns[i][0].search(text):
+                    best = i
+                    break
+            if best < len(self._patterns):
+                best_intent = self._patterns[best][1]
+        else:
+            for compiled, intent_name in self._patterns:
+                if compiled.search(text):
+                    best_intent = intent_name
+                    break
+
+        return best_intent, name
+
+    def predict_intent(self, text: str) -> tuple[str, dict[str, str]]:
         """Return the best-matching intent name and any extracted entities.
 
         For simplicity, we return the first intent whose regex matches the text.
+        Results for short messages are cached, so repeats (like "hi") skip the regexes.
         """
         text = text.strip()
-        entities: Dict[str, str] = {}
+        if len(text) <= _CACHE_MAX_LEN:
+            best_intent, name = self._match_cached(text)
+        else:
+            best_intent, name = self._match(text)
 
-        # Extract entities regardless of which intent we end up with
-        name = self._extract_name(text)
+        # Build a fresh dict each time; callers may modify it
+        entities: dict[str, str] = {}
         if name:
             entities["name"] = name
-
-        # Find the first intent whose pattern matches the text
-        best_intent: Optional[str] = None
-        for name_i, patterns in self._compiled.items():
-            if any(p.search(text) for p in patterns):
-                best_intent = name_i
-                break
-
-        if best_intent is None:
-            # Fall back to a special intent if nothing else matched
-            best_intent = "fallback"
-
         return best_intent, entities
 
     def respond(self, text: str) -> str:
@@ -104,48 +263,91 @@ class MiniAI:
         intent_name, entities = self.predict_intent(text)
         return self.render_response(intent_name, entities)
 
-    def _apply_dynamic(self, intent_name: str, entities: Dict[str, str]) -> Dict[str, str]:
-        """Inject dynamic values for certain intents (e.g., current time)."""
-        if intent_name == "time":
-            from datetime import datetime
-            out = dict(entities)
-            out["time"] = datetime.now().strftime("%I:%M %p").lstrip("0")
-            return out
-        return entities
-
-    def render_response(self, intent_name: str, entities: Dict[str, str]) -> str:
+    def render_response(self, intent_name: str, entities: dict[str, str]) -> str:
         """Render a response for a known intent using provided entities.
 
         This is useful when callers want to merge additional context (e.g.,
         session memory) into the entities before rendering.
         """
-        intent = self.intents.get(intent_name)
-        if not intent:
+        templates = self._templates.get(intent_name)
+        if not templates:
             return self.default_response
 
         # Choose one of the possible responses at random (for variety)
-        template = random.choice(intent.responses) if intent.responses else self.default_response
+        template, parts = random.choice(templates)
+
+        # Inject dynamic fields as needed (e.g., time). Most intents have none,
+        # so we use `entities` as-is and only copy it when adding a value.
+        dynamic = _DYNAMIC.get(intent_name)
+        enriched = entities if dynamic is None else {**entities, dynamic[0]: dynamic[1]()}
+        # Fill placeholders like {name}
+        if parts is None:
+            return template.format_map(_SafeDict(enriched))
+        return "".join([lit if key is None else lit + str(enriched.get(key, "")) for lit, key in parts])
 
-        # Fill placeholders like {name}. If a placeholder is missing, use "" instead of raising an error.
-        class _SafeDict(dict):
-            def __missing__(self, key):  # type: ignore[override]
-                return ""
 
-        # Inject dynamic fields as needed (e.g., time)
-        enriched = self._apply_dynamic(intent_name, entities)
-        return template.format_map(_SafeDict(enriched))
+def _load_raw(path: str, use_cache: bool = True) -> dict[str, Any]:
+    """Read the intents YAML file into a plain dictionary.
+
+    Parsing YAML is slow compared to JSON, so after parsing we save the result
+    next to the YAML file (e.g. data/intents.cache.json), together with a hash
+    of the YAML text. Later startups load that JSON instead, but only if the
+    hash still matches the YAML file exactly. Any problem with the cache
+    (missing, stale, unreadable, read-only folder) just means we parse the
+    YAML again.
+    """
+    # Read the file once; the hash and the YAML parse both use these bytes,
+    # so the cache always describes exactly the text we parsed.
+    with open(path, "rb") as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+
+    cache = Path(path).with_suffix(".cache.json")
+    if use_cache:
+        try:
+            with open(cache, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("source_sha256") == digest:
+                return cached["intents"]
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass  # No usable cache: fall through and parse the YAML
 
+    # Local import so this file has minimal top-level dependencies
+    import yaml  # type: ignore[import-untyped]
 
-def build_from_yaml(path: str) -> MiniAI:
-    """Create a MiniAI instance by reading intents from a YAML file."""
-    import yaml  # Local import so this file has minimal top-level dependencies
+    # Prefer the libyaml-backed C loader (much faster); it's only there when
+    # PyYAML was built against libyaml, so fall back to the pure-Python one.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
     # Load YAML into a Python dictionary
-    with open(path, "r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f) or {}
+    raw = yaml.load(data.decode("utf-8"), Loader=loader) or {}
+
+    if use_cache:
+        # Write to a temporary file first, then swap it in, so another process
+        # starting at the same time never sees a half-written cache.
+        tmp = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"source_sha256": digest, "intents": raw}, f)
+            os.replace(tmp, cache)
+        except (OSError, TypeError, ValueError):
+            # Read-only folder, or YAML values JSON can't store (e.g. dates)
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+    return raw
+
+
+def build_from_yaml(path: str, use_cache: bool = True) -> MiniAI:
+    """Create a MiniAI instance by reading intents from a YAML file.
+
+    Set `use_cache=False` to always parse the YAML (see `_load_raw`).
+    """
+    raw = _load_raw(path, use_cache=use_cache)
 
     # Convert the raw data into Intent objects
-    intents_map: Dict[str, Intent] = {}
+    intents_map: dict[str, Intent] = {}
     for item in raw.get("intents", []):
         name = item.get("name")
         patterns = item.get("patterns", [])
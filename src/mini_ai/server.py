@@ -9,12 +9,15 @@ This keeps everything very small and easy to understand for beginners.
 """
 from __future__ import annotations
 
+from collections import OrderedDict
 from pathlib import Path
+import hashlib
 import os
-import uuid
+import secrets
 from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from .engine import build_from_yaml
@@ -26,7 +29,8 @@ ROOT = Path(__file__).resolve().parent.parent.parent
 INTENTS_PATH = Path(os.getenv("INTENTS_PATH", str(ROOT / "data" / "intents.yml")))
 WEB_INDEX = ROOT / "web" / "index.html"
 
-app = FastAPI(title="Mini AI API")
+# Serialize JSON responses with orjson (a fast C library) instead of the stdlib json module
+app = FastAPI(title="Mini AI API", default_response_class=ORJSONResponse)
 
 # Allow the demo page to call the API from a browser
 allow_origins_env = os.getenv("CORS_ALLOW_ORIGINS", "*")
@@ -40,11 +44,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress responses larger than 256 bytes (mostly the HTML page) for
+# browsers that accept gzip; tiny /chat replies are sent as-is.
+app.add_middleware(GZipMiddleware, minimum_size=256)
+
 
 class ChatRequest(BaseModel):
     message: str
 
 
+# Documents the /chat reply in the OpenAPI schema only. It isn't used as a
+# response_model, so FastAPI doesn't re-validate every reply.
 class ChatResponse(BaseModel):
     reply: str
 
@@ -52,29 +62,70 @@ class ChatResponse(BaseModel):
 # Build bot once on startup
 bot = build_from_yaml(str(INTENTS_PATH))
 
+# Read the web page once at startup and serve it from memory. The ETag lets
+# browsers revalidate cheaply: if their copy is current they get a
+# "304 Not Modified" with no body. (Restart the server after editing it.)
+# It's a weak ETag (W/"...") because the same page is sent both gzipped and
+# uncompressed, and a strong ETag must differ between those encodings.
+INDEX_HTML = WEB_INDEX.read_bytes() if WEB_INDEX.exists() else None
+INDEX_ETAG = f'W/"{hashlib.sha1(INDEX_HTML).hexdigest()}"' if INDEX_HTML is not None else ""
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against `etag` using weak comparison.
+
+    "*" matches any current page; otherwise the header is a comma-separated
+    list of ETags, compared with their W/ prefixes ignored.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if (tag[2:] if tag.startswith("W/") else tag) == opaque:
+            return True
+    return False
+
+
 # Very small in-memory session store: { session_id: {"name": "Alice"} }
-SESSIONS: dict[str, dict[str, str]] = {}
+# It's kept in least-recently-used order and capped at MAX_SESSIONS entries,
+# so memory stays bounded no matter how many visitors show up.
+SESSIONS: OrderedDict[str, dict[str, str]] = OrderedDict()
 SESSION_COOKIE = os.getenv("SESSION_COOKIE", "mini_ai_sid")
+MAX_SESSIONS = int(os.getenv("MAX_SESSIONS", "10000"))
 
 
+# The handlers below are `async def` so FastAPI runs them directly on the
+# event loop instead of a worker thread. That's fine here because they do
+# only quick in-memory work (no blocking I/O).
 @app.get("/")
-def serve_index():
-    if not WEB_INDEX.exists():
+async def serve_index(request: Request):
+    if INDEX_HTML is None:
         raise HTTPException(status_code=404, detail="index.html not found")
-    return FileResponse(str(WEB_INDEX))
+    headers = {"ETag": INDEX_ETAG, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match", ""), INDEX_ETAG):
+        return Response(status_code=304, headers=headers)
+    return Response(content=INDEX_HTML, media_type="text/html", headers=headers)
 
 
-@app.post("/chat", response_model=ChatResponse)
-def chat(req: ChatRequest, request: Request, response: Response):
+@app.post("/chat", responses={200: {"model": ChatResponse}})
+async def chat(req: ChatRequest, request: Request, response: Response):
     if not req.message.strip():
-        return ChatResponse(reply="Please type something.")
+        return {"reply": "Please type something."}
 
     # Get or create a session id from cookies
     sid = request.cookies.get(SESSION_COOKIE)
     if not sid:
-        sid = uuid.uuid4().hex
+        sid = secrets.token_hex(16)
         response.set_cookie(key=SESSION_COOKIE, value=sid, httponly=True, samesite="lax")
-    memory = SESSIONS.setdefault(sid, {})
+    memory = SESSIONS.get(sid)
+    if memory is None:
+        memory = SESSIONS[sid] = {}
+        if len(SESSIONS) > MAX_SESSIONS:
+            # Forget the session that has been idle the longest
+            SESSIONS.popitem(last=False)
+    else:
+        SESSIONS.move_to_end(sid)
 
     # Predict intent and entities from the message
     intent_name, entities = bot.predict_intent(req.message)
@@ -88,4 +139,4 @@ def chat(req: ChatRequest, request: Request, response: Response):
 
     # Render final response using merged entities
     reply = bot.render_response(intent_name, merged)
-    return ChatResponse(reply=reply)
+    return {"reply": reply}